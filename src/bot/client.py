@@ -1,4 +1,5 @@
 import sys
+import threading
 import traceback
 import discord
 from discord.ext import commands
@@ -20,7 +21,9 @@ class MusicBot(commands.Bot):
     
     Attributes:
         config (dict): Configuration du bot chargée depuis config.yaml
+        ffmpeg_path (str): Exécutable FFmpeg résolu depuis la configuration
         ytdl (YoutubeDL): Instance de yt-dlp pour le téléchargement
+        ytdl_lock (Lock): Sérialise les extractions sur l'instance ytdl partagée
         music_players (dict): Dictionnaire des lecteurs de musique par serveur
     """
 
@@ -36,6 +39,9 @@ class MusicBot(commands.Bot):
         """
         self.config = load_config()
         
+        # Résolution unique de l'exécutable FFmpeg, partagée par tous les lecteurs
+        self.ffmpeg_path = self.config.get('ffmpeg_path', 'ffmpeg')
+        
         # Configuration des intentions Discord nécessaires
         intents = discord.Intents.default()
         intents.message_content = True  # Permet la lecture du contenu des messages
@@ -48,7 +54,11 @@ class MusicBot(commands.Bot):
         )
         
         # Initialisation du gestionnaire YouTube-DL avec les options optimisées
-        self.ytdl = yt_dlp.YoutubeDL(YTDL_OPTIONS)
+        # (copie modifiable : yt-dlp complète ses paramètres en place)
+        self.ytdl = yt_dlp.YoutubeDL(dict(YTDL_OPTIONS))
+        # YoutubeDL garde un état par instance : les lecteurs l'utilisent
+        # depuis leurs pools de threads, une extraction à la fois
+        self.ytdl_lock = threading.Lock()
         
         # Stockage des lecteurs de musique par serveur
         self.music_players = {}
@@ -69,8 +79,8 @@ class MusicBot(commands.Bot):
     async def on_ready(self):
         """Appelé lorsque le bot est prêt et connecté"""
         logger = logging.getLogger(__name__)
-        logger.info(f"Bot connecté en tant que {self.user}")
-        logger.info(f"ID du bot: {self.user.id}")
+        logger.info("Bot connecté en tant que %s", self.user)
+        logger.info("ID du bot: %s", self.user.id)
         logger.info("Bot prêt à recevoir des commandes!")
 
     async def on_voice_state_update(self, member, before, after):
@@ -222,7 +222,7 @@ class Music(commands.Cog):
             # Send error message if cleanup fails
             embed = discord.Embed(
                 title=MESSAGES['ERROR_TITLE'],
-                description=MESSAGES['CLEANUP_ERROR'].format(str(e)),
+                description=MESSAGES['CLEANUP_ERROR'] % e,
                 color=COLORS['ERROR']
             )
             await ctx.send(embed=embed)
@@ -1,15 +1,40 @@
 import asyncio
 import discord
-from discord import FFmpegPCMAudio
 from concurrent.futures import ThreadPoolExecutor
 from collections import deque
 import gc
-import os
+import logging
 import math
+import threading
 import yt_dlp
 import requests
 from core.queue_view import QueueView
-from utils.constants import YTDL_OPTIONS, FFMPEG_OPTIONS, MESSAGES, COLORS
+from utils import ytdl_cache
+from utils.constants import (
+    FFMPEG_OPTIONS, MESSAGES, COLORS,
+    YTDL_EXTRACT_URL_OPTIONS, YTDL_EXTRACT_SEARCH_OPTIONS
+)
+
+logger = logging.getLogger(__name__)
+
+def _format_queue_duration(seconds):
+    """
+    Formate une durée pour l'affichage de la file d'attente.
+    
+    Définie au niveau du module pour ne pas recréer une fermeture à chaque
+    affichage de la file d'attente.
+    
+    Args:
+        seconds (int): Durée en secondes
+    
+    Returns:
+        str: Durée entre accents graves, `HH:MM:SS` ou `MM:SS`
+    """
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours > 0:
+        return f"`{hours:02d}:{minutes:02d}:{seconds:02d}`"
+    return f"`{minutes:02d}:{seconds:02d}`"
 
 class MusicPlayer:
     """
@@ -41,6 +66,9 @@ class MusicPlayer:
         live_stream (dict): Informations de la diffusion en direct
         live_embed (Message): Embed de la diffusion en direct
         live_task (Task): Tâche pour la mise à jour de l'embed de la diffusion en direct
+        playback_done (Event): Signalé lorsque le flux audio en cours se termine
+        ydl_instances (dict): Couples (YoutubeDL, Lock) de _extract_info, par type de requête
+        ydl_instances_lock (Lock): Protège la création des instances YoutubeDL
     """
     
     def __init__(self, bot, ctx):
@@ -73,6 +101,9 @@ class MusicPlayer:
         self.live_stream = None
         self.live_embed = None
         self.live_task = None
+        self.playback_done = asyncio.Event()  # Signalé par le callback after= de voice_client.play
+        self.ydl_instances = {}  # Réutilisées d'un appel à l'autre, indexées par is_url
+        self.ydl_instances_lock = threading.Lock()  # Appelé depuis le pool de threads
         
     async def ensure_voice_client(self):
         """
@@ -103,7 +134,7 @@ class MusicPlayer:
             raise ValueError(MESSAGES['VOICE_CHANNEL_REQUIRED'])
 
         except Exception as e:
-            print(f"Voice client initialization error: {str(e)}")
+            logger.error("Voice client initialization error: %s", e)
             raise
 
     async def start_processing(self):
@@ -118,83 +149,86 @@ class MusicPlayer:
                 song = await self.processing_queue.get()
                 if song.get('needs_processing', False):
                     try:
-                        # Use cached data if available
-                        if hasattr(self, '_cached_urls') and song['url'] in self._cached_urls:
-                            song.update(self._cached_urls[song['url']])
-                        else:
-                            video_data = await asyncio.get_event_loop().run_in_executor(
-                                self.thread_pool,
-                                self._process_url,
-                                song['url']
-                            )
-                            song.update(video_data)
-                            # Cache the result
-                            if not hasattr(self, '_cached_urls'):
-                                self._cached_urls = {}
-                            self._cached_urls[song['url']] = video_data
+                        # _process_url passe par le cache partagé (avec expiration)
+                        video_data = await asyncio.get_event_loop().run_in_executor(
+                            self.thread_pool,
+                            self._process_url,
+                            song['url']
+                        )
+                        song.update(video_data)
                         song['needs_processing'] = False
                     except Exception as e:
-                        print(f"Error processing {song['url']}: {e}")
+                        logger.warning("Error processing %s: %s", song['url'], e)
                         if song in self.queue:
                             self.queue.remove(song)
                 self.processing_queue.task_done()
         except asyncio.CancelledError:
             pass
 
+    def _ytdl_extract(self, url, cached=True):
+        """
+        Extrait les informations avec l'instance yt-dlp partagée du bot
+        (s'exécute dans le pool de threads)
+        
+        Args:
+            url (str): URL ou requête passée à yt-dlp
+            cached (bool, optional): Passe par le cache des métadonnées. Défaut à True
+        
+        Notes:
+            L'instance est partagée par tous les serveurs : l'extraction se fait
+            sous bot.ytdl_lock
+        """
+        if cached:
+            return ytdl_cache.extract_info(self.bot.ytdl, url, self.bot.ytdl_lock)
+        with self.bot.ytdl_lock:
+            return self.bot.ytdl.extract_info(url, download=False)
+
     def _process_url(self, url):
         """
         Traite une seule URL (s'exécute dans le pool de threads)
         """
-        with yt_dlp.YoutubeDL(YTDL_OPTIONS) as ydl:
-            info = ydl.extract_info(url, download=False)
-            return {
-                'url': info['url'],
-                'title': info['title'],
-                'duration': info.get('duration', 0)
-            }
+        info = self._ytdl_extract(url)
+        # Garde l'URL de la page : play_next doit retrouver le codec (acodec)
+        # pour copier l'Opus sans réencodage, ce qu'un lien direct ne donne pas
+        return {
+            'url': info.get('webpage_url', url),
+            'title': info['title'],
+            'duration': info.get('duration', 0)
+        }
 
     async def add_to_queue(self, query):
         try:
-            # Fast initial metadata extraction
-            with yt_dlp.YoutubeDL({
-                'format': 'bestaudio',
-                'quiet': True,
-                'no_warnings': True,
-                'extract_flat': False,
-                'skip_download': True,
-                'force_generic_extractor': True,
-                'socket_timeout': 2,
-                'retries': 1
-            }) as ydl:
-                # Direct extraction without playlist check for first song
-                info = await asyncio.get_event_loop().run_in_executor(
-                    None, 
-                    lambda: ydl.extract_info(query, download=False)
-                )
-                
-                if not info:
-                    raise Exception(MESSAGES['VIDEO_UNAVAILABLE'])
+            # Fast initial metadata extraction with the bot's shared YoutubeDL instance
+            info = await asyncio.get_event_loop().run_in_executor(
+                None, 
+                lambda: self._ytdl_extract(query)
+            )
+            
+            if not info:
+                raise Exception(MESSAGES['VIDEO_UNAVAILABLE'])
 
-                # Add to queue with minimal processing
-                song = {
-                    'url': info.get('url', info.get('webpage_url', query)),
-                    'title': info.get('title', 'Unknown'),
-                    'duration': info.get('duration', 0),
-                    'needs_processing': False
-                }
-                self.queue.append(song)
+            # Add to queue with minimal processing
+            # (URL de la page : l'extraction au moment de la lecture passe par le
+            # cache et garde le codec, nécessaire au passage direct de l'Opus)
+            song = {
+                'url': info.get('webpage_url', query),
+                'title': info.get('title', 'Unknown'),
+                'duration': info.get('duration', 0),
+                'needs_processing': False
+            }
+            self.queue.append(song)
+            
+            # Start playing immediately if nothing is playing
+            if not self.voice_client or not self.voice_client.is_playing():
+                await self.play_next()
+            else:
+                embed = discord.Embed(
+                    description=MESSAGES['SONG_ADDED'],
+                    color=COLORS['SUCCESS']
+                )
+                await self.ctx.send(embed=embed)
+                await self.ctx.send(embed=await self.get_queue_display())
                 
-                # Start playing immediately if nothing is playing
-                if not self.voice_client or not self.voice_client.is_playing():
-                    await self.play_next()
-                else:
-                    embed = discord.Embed(
-                        description=MESSAGES['SONG_ADDED'].format(song['title']),
-                        color=COLORS['SUCCESS']
-                    )
-                    await self.ctx.send(embed=embed)
-                    await self.ctx.send(embed=await self.get_queue_display())
-                    
         except Exception as e:
             error_embed = discord.Embed(
                 title=MESSAGES['ERROR_TITLE'],
@@ -206,32 +240,42 @@ class MusicPlayer:
     def _extract_info(self, query):
         """
         Extrait les informations depuis YouTube (s'exécute dans le pool de threads)
+        
+        Notes:
+            - Une instance YoutubeDL par type de requête (URL ou recherche) est
+              créée au premier appel puis réutilisée, et fermée par cleanup()
+            - YoutubeDL garde un état par instance (listes de lecture en cours) :
+              chaque instance ne sert qu'à une extraction à la fois
         """
         is_url = query.startswith(('http://', 'https://', 'www.'))
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': 'in_playlist' if is_url else False,
-            'format': 'ba[ext=webm]',  # Prefer webm audio format
-            'default_search': 'ytsearch' if not is_url else None,
-            'concurrent_fragments': 10,  # Increased from 5
-            'postprocessor_args': {
-                'ffmpeg': ['-threads', '3']
-            },
-            'buffersize': 131072,  # Doubled buffer size
-            'socket_timeout': 2,
-            'extractor_retries': 1,  # Reduced retries
-            'nocheckcertificate': True,
-            'prefer_insecure': True,
-            'http_chunk_size': 20971520,  # 20MB chunks
-            'live_from_start': False,
-            'cachedir': False,  # Disable cache
-            'progress_hooks': [],  # Disable progress hooks
-            'no_color': True,
-        }
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        with self.ydl_instances_lock:
+            entry = self.ydl_instances.get(is_url)
+            if entry is None:
+                ydl_opts = YTDL_EXTRACT_URL_OPTIONS if is_url else YTDL_EXTRACT_SEARCH_OPTIONS
+                # La construction de YoutubeDL (extracteurs, cookies, options) est coûteuse
+                # YoutubeDL modifie le dict d'options reçu : on lui passe une copie
+                entry = (yt_dlp.YoutubeDL(dict(ydl_opts)), threading.Lock())
+                self.ydl_instances[is_url] = entry
+        
+        ydl, ydl_lock = entry
+        with ydl_lock:
             return ydl.extract_info(query, download=False)
 
+    def _close_ydl_instances(self):
+        """
+        Ferme les instances YoutubeDL de _extract_info (bloquant)
+        
+        Notes:
+            Prend le verrou de chaque instance : une extraction encore en cours
+            dans le pool de threads se termine avant la fermeture
+        """
+        with self.ydl_instances_lock:
+            entries = list(self.ydl_instances.values())
+            self.ydl_instances.clear()
+        for ydl, ydl_lock in entries:
+            with ydl_lock:
+                ydl.close()
+
     async def process_video(self, video_url):
         """
         Traite la vidéo avec des paramètres optimisés
@@ -240,7 +284,7 @@ class MusicPlayer:
             loop = asyncio.get_running_loop()
             video_data = await loop.run_in_executor(
                 None,
-                lambda: self.bot.ytdl.extract_info(video_url, download=False)
+                lambda: self._ytdl_extract(video_url, cached=False)
             )
             
             # Pré-traite l'URL du flux pour réduire le temps de démarrage de la lecture
@@ -254,6 +298,80 @@ class MusicPlayer:
         except Exception as e:
             raise e
 
+    async def _create_audio_source(self, info):
+        """
+        Crée la source audio Discord pour un flux extrait par yt-dlp.
+        
+        Args:
+            info (dict): Informations du flux retournées par yt-dlp
+        
+        Returns:
+            AudioSource: Source prête à être jouée par le client vocal
+            
+        Notes:
+            - Un flux déjà en Opus est copié tel quel, sans décodage PCM
+              ni réencodage Opus par discord.py
+            - Les autres codecs passent par le pipeline PCM habituel
+            - Le lancement du processus FFmpeg (fork/exec) se fait dans un
+              thread pour ne pas bloquer la boucle d'événements
+        """
+        if info.get('acodec') == 'opus':
+            return await asyncio.to_thread(
+                discord.FFmpegOpusAudio,
+                info['url'],
+                codec='copy',
+                **FFMPEG_OPTIONS,
+                executable=self.bot.ffmpeg_path
+            )
+        return await asyncio.to_thread(
+            discord.FFmpegPCMAudio,
+            info['url'],
+            **FFMPEG_OPTIONS,
+            executable=self.bot.ffmpeg_path
+        )
+
+    def _play_audio(self, audio, after=None):
+        """
+        Lance la lecture d'une source audio sur le client vocal.
+        
+        Args:
+            audio (AudioSource): Source à jouer
+            after (callable, optional): Callback appelé en fin de lecture
+                depuis le thread audio, avec l'erreur éventuelle
+        
+        Notes:
+            Signale playback_done dans la boucle du bot à la fin du flux,
+            pour que _stop_playback n'attende que le temps nécessaire
+        """
+        self.playback_done.clear()
+        loop = self.bot.loop
+        
+        def _after(error):
+            loop.call_soon_threadsafe(self.playback_done.set)
+            if after:
+                after(error)
+        
+        self.voice_client.play(audio, after=_after)
+
+    async def _stop_playback(self, timeout=0.5):
+        """
+        Arrête la lecture en cours et attend la fin effective du flux.
+        
+        Args:
+            timeout (float, optional): Attente maximale en secondes. Défaut à 0.5
+        
+        Notes:
+            Remplace un délai fixe après stop() : rend la main dès que le
+            thread audio a signalé la fin de lecture
+        """
+        if not self.voice_client or not self.voice_client.is_playing():
+            return
+        self.voice_client.stop()
+        try:
+            await asyncio.wait_for(self.playback_done.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
     async def play_next(self):
         """
         Joue la prochaine chanson dans la file d'attente
@@ -296,21 +414,18 @@ class MusicPlayer:
                 # Get fresh audio URL
                 info = await asyncio.get_event_loop().run_in_executor(
                     self.thread_pool,
-                    lambda: self.bot.ytdl.extract_info(song['url'], download=False)
+                    lambda: self._ytdl_extract(song['url'])
                 )
                 
                 if info.get('url'):
-                    audio = discord.FFmpegPCMAudio(
-                        info['url'],
-                        **FFMPEG_OPTIONS
-                    )
+                    audio = await self._create_audio_source(info)
                     
                     def after_callback(error):
                         if error:
-                            print(f"Error in playback: {error}")
+                            logger.error("Error in playback: %s", error)
                         asyncio.run_coroutine_threadsafe(self.play_next(), self.bot.loop)
                     
-                    self.voice_client.play(audio, after=after_callback)
+                    self._play_audio(audio, after=after_callback)
                     await self.ctx.send(embed=await self.get_queue_display())
                     
             except Exception as e:
@@ -364,15 +479,8 @@ class MusicPlayer:
     async def get_queue_display(self):
         embed = discord.Embed(color=COLORS['INFO'])
         
-        def format_duration(seconds):
-            minutes, seconds = divmod(seconds, 60)
-            hours, minutes = divmod(minutes, 60)
-            if hours > 0:
-                return f"`{hours:02d}:{minutes:02d}:{seconds:02d}`"
-            return f"`{minutes:02d}:{seconds:02d}`"
-        
         if self.current:
-            duration = format_duration(self.current.get('duration', 0))
+            duration = _format_queue_duration(self.current.get('duration', 0))
             embed.add_field(
                 name=MESSAGES['NOW_PLAYING'],
                 value=f"{self.current['title']} {duration}",
@@ -383,7 +491,7 @@ class MusicPlayer:
         if self.queue and self.current:
             next_songs = list(self.queue)[:3]
             next_songs_text = "\n".join(
-                f"{i+1}. {song['title']} {format_duration(song.get('duration', 0))}"
+                f"{i+1}. {song['title']} {_format_queue_duration(song.get('duration', 0))}"
                 for i, song in enumerate(next_songs)
             )
             embed.add_field(
@@ -394,7 +502,7 @@ class MusicPlayer:
             
             remaining = len(self.queue) - 3
             if remaining > 0:
-                embed.set_footer(text=MESSAGES['REMAINING_SONGS'].format(remaining))
+                embed.set_footer(text=MESSAGES['REMAINING_SONGS'] % remaining)
         
         if not self.current and not self.queue:
             embed.description = MESSAGES['QUEUE_EMPTY_SAD']
@@ -435,7 +543,7 @@ class MusicPlayer:
         except asyncio.CancelledError:
             pass
         except Exception as e:
-            print(f"Error in delayed_disconnect: {e}")
+            logger.error("Error in delayed_disconnect: %s", e)
 
     async def cleanup(self):
         """Nettoie les ressources et les fichiers téléchargés"""
@@ -490,16 +598,14 @@ class MusicPlayer:
             self.loop_user = None
             
             # Clear caches
-            if hasattr(self, '_cached_urls'):
-                self._cached_urls.clear()
-            if hasattr(self, '_song_cache'):
-                self._song_cache.clear()
+            # Attend hors de la boucle la fin des extractions en cours
+            await asyncio.to_thread(self._close_ydl_instances)
             
             # Force garbage collection
             gc.collect()
             
         except Exception as e:
-            print(f"Error during cleanup: {e}")
+            logger.error("Error during cleanup: %s", e)
             raise
 
     async def preload_next_songs(self):
@@ -523,19 +629,12 @@ class MusicPlayer:
 
     async def get_detailed_queue(self, show_all=False):
         """Obtient l'affichage détaillé de la file d'attente"""
-        def format_duration(seconds):
-            minutes, seconds = divmod(seconds, 60)
-            hours, minutes = divmod(minutes, 60)
-            if hours > 0:
-                return f"`{hours:02d}:{minutes:02d}:{seconds:02d}`"
-            return f"`{minutes:02d}:{seconds:02d}`"
-        
         if not show_all:
             # Comportement original pour !queue
             embed = discord.Embed(title="File d'attente détaillée", color=COLORS['INFO'])
             
             if self.current:
-                duration = format_duration(self.current.get('duration', 0))
+                duration = _format_queue_duration(self.current.get('duration', 0))
                 embed.add_field(
                     name=MESSAGES['NOW_PLAYING'],
                     value=f"{self.current['title']} {duration}",
@@ -545,7 +644,7 @@ class MusicPlayer:
             queue_list = list(self.queue)[:10]  # Affiche les 10 premières chansons
             if queue_list:
                 queue_text = "\n".join(
-                    f"`{i}.` {song['title']} {format_duration(song.get('duration', 0))}"
+                    f"`{i}.` {song['title']} {_format_queue_duration(song.get('duration', 0))}"
                     for i, song in enumerate(queue_list, 1)
                 )
                 embed.add_field(
@@ -556,7 +655,7 @@ class MusicPlayer:
                 
                 remaining = len(self.queue) - 10
                 if remaining > 0:
-                    embed.set_footer(text=MESSAGES['REMAINING_SONGS'].format(remaining))
+                    embed.set_footer(text=MESSAGES['REMAINING_SONGS'] % remaining)
             else:
                 embed.description = MESSAGES['QUEUE_EMPTY_SAD']
                 
@@ -581,7 +680,7 @@ class MusicPlayer:
                 
                 # Add current song to first page only
                 if page == 0 and self.current:
-                    duration = format_duration(self.current.get('duration', 0))
+                    duration = _format_queue_duration(self.current.get('duration', 0))
                     embed.add_field(
                         name=MESSAGES['NOW_PLAYING'],
                         value=f"{self.current['title']} {duration}",
@@ -590,7 +689,7 @@ class MusicPlayer:
                 
                 if current_page_songs:
                     queue_text = "\n".join(
-                        f"`{i}.` {song['title']} {format_duration(song.get('duration', 0))}"
+                        f"`{i}.` {song['title']} {_format_queue_duration(song.get('duration', 0))}"
                         for i, song in enumerate(current_page_songs, start_idx + 1)
                     )
                     embed.add_field(
@@ -671,16 +770,14 @@ class MusicPlayer:
         try:
             # Clear queue and stop current playback first
             self.queue.clear()
-            if self.voice_client and self.voice_client.is_playing():
-                self.voice_client.stop()
-                await asyncio.sleep(0.5)  # Wait for playback to fully stop
+            await self._stop_playback()
 
             # Set up the song to loop
             if query:
                 # Extract info with updated options
                 info = await asyncio.get_event_loop().run_in_executor(
                     self.thread_pool,
-                    lambda: self.bot.ytdl.extract_info(query, download=False)
+                    lambda: self._ytdl_extract(query)
                 )
                 
                 if 'entries' in info:
@@ -736,9 +833,9 @@ class MusicPlayer:
         duration = (discord.utils.utcnow() - self.loop_start_time).total_seconds()
         
         embed.add_field(
-            name=MESSAGES['LOOP_ENABLED'].format(self.loop_song['title']),
-            value=f"{MESSAGES['LOOP_SINCE'].format(self._format_duration(duration))}\n"
-                 f"{MESSAGES['LOOP_BY'].format(self.loop_user.name)}",
+            name=MESSAGES['LOOP_ENABLED'] % self.loop_song['title'],
+            value=f"{MESSAGES['LOOP_SINCE'] % self._format_duration(duration)}\n"
+                 f"{MESSAGES['LOOP_BY'] % self.loop_user.name}",
             inline=False
         )
         return embed
@@ -754,7 +851,7 @@ class MusicPlayer:
         except asyncio.CancelledError:
             pass
         except Exception as e:
-            print(f"Error updating loop message: {e}")
+            logger.warning("Error updating loop message: %s", e)
 
     async def play_loop_song(self):
         """Méthode auxiliaire pour jouer la chanson en boucle"""
@@ -762,23 +859,17 @@ class MusicPlayer:
             return
 
         try:
-            if self.voice_client.is_playing():
-                self.voice_client.stop()
-                await asyncio.sleep(0.5)  # Ajoute un petit délai pour assurer le nettoyage
+            await self._stop_playback()
             
             # Obtient une nouvelle URL pour l'audio
             info = await asyncio.get_event_loop().run_in_executor(
                 self.thread_pool,
-                lambda: self.bot.ytdl.extract_info(self.loop_song['url'], download=False)
+                lambda: self._ytdl_extract(self.loop_song['url'])
             )
             
             if info.get('url'):
-                audio = discord.FFmpegPCMAudio(
-                    info['url'],
-                    **FFMPEG_OPTIONS,
-                    executable=self.bot.config.get('ffmpeg_path', 'ffmpeg')
-                )
-                self.voice_client.play(
+                audio = await self._create_audio_source(info)
+                self._play_audio(
                     audio,
                     after=lambda e: asyncio.run_coroutine_threadsafe(
                         self._handle_loop_playback(e), 
@@ -786,7 +877,7 @@ class MusicPlayer:
                     )
                 )
         except Exception as e:
-            print(f"Error in play_loop_song: {e}")
+            logger.error("Error in play_loop_song: %s", e)
             self.loop = False
             if self.loop_task:
                 self.loop_task.cancel()
@@ -794,7 +885,7 @@ class MusicPlayer:
     async def _handle_loop_playback(self, error):
         """Gère la fin de lecture en boucle ou les erreurs"""
         if error:
-            print(f"Erreur dans la lecture en boucle : {error}")  # Traduit le message d'erreur
+            logger.error("Erreur dans la lecture en boucle : %s", error)
             return
         
         if self.loop:
@@ -823,21 +914,21 @@ class MusicPlayer:
                 query
             )
             
-            total_songs_added = 0
-            
-            if 'entries' in info:  # Playlist
-                entries = [e for e in info['entries'] if e]
-                for _ in range(repeat_count):
-                    for entry in entries:
-                        song = {
-                            'url': f"https://www.youtube.com/watch?v={entry['id']}",
-                            'title': entry.get('title', 'Unknown Title'),
-                            'duration': entry.get('duration', 0),
-                            'needs_processing': True
-                        }
-                        self.queue.append(song)
-                        await self.processing_queue.put(song)
-                        total_songs_added += 1
+            entries = info.get('entries')
+            if entries is not None:  # Playlist
+                # Chaque répétition reçoit son propre dict : le traitement
+                # en arrière-plan met à jour les chansons sur place
+                entries = [e for e in entries if e]
+                songs = [
+                    {
+                        'url': f"https://www.youtube.com/watch?v={entry['id']}",
+                        'title': entry.get('title', 'Unknown Title'),
+                        'duration': entry.get('duration', 0),
+                        'needs_processing': True
+                    }
+                    for _ in range(repeat_count)
+                    for entry in entries
+                ]
             else:  # Single video
                 song_template = {
                     'url': info['webpage_url'],
@@ -845,11 +936,12 @@ class MusicPlayer:
                     'duration': info.get('duration', 0),
                     'needs_processing': True
                 }
-                for _ in range(repeat_count):
-                    song = song_template.copy()
-                    self.queue.append(song)
-                    await self.processing_queue.put(song)
-                    total_songs_added += 1
+                songs = [song_template.copy() for _ in range(repeat_count)]
+            
+            self.queue.extend(songs)
+            for song in songs:
+                self.processing_queue.put_nowait(song)  # File non bornée : ne bloque jamais
+            total_songs_added = len(songs)
             
             # Start playing if nothing is playing
             if not self.voice_client.is_playing():
@@ -857,7 +949,7 @@ class MusicPlayer:
             else:
                 # Send confirmation message with correct formatting
                 embed = discord.Embed(
-                    description=MESSAGES['SONGS_ADDED'].format(total=total_songs_added),
+                    description=MESSAGES['SONGS_ADDED'] % total_songs_added,
                     color=COLORS['SUCCESS']
                 )
                 await self.ctx.send(embed=embed)
@@ -873,15 +965,11 @@ class MusicPlayer:
     async def _prefetch_song(self, song):
         """Pre-fetch song data to reduce loading time"""
         try:
-            if not hasattr(self, '_song_cache'):
-                self._song_cache = {}
-                
-            if song['url'] not in self._song_cache:
+            if ytdl_cache.metadata_cache.get(song['url']) is None:
                 info = await asyncio.get_event_loop().run_in_executor(
                     self.thread_pool,
-                    lambda: self.bot.ytdl.extract_info(song['url'], download=False)
+                    lambda: self._ytdl_extract(song['url'])
                 )
-                self._song_cache[song['url']] = info
                 
                 # Pre-warm connection
                 if 'url' in info:
@@ -890,15 +978,15 @@ class MusicPlayer:
                         lambda: requests.head(info['url'], timeout=2)
                     )
         except Exception as e:
-            print(f"Prefetch error: {e}")
+            logger.debug("Prefetch error: %s", e)
 
     async def start_live(self, url):
         """Start a live stream"""
         try:
-            # Stop current playback and clear queue
-            if self.voice_client and self.voice_client.is_playing():
-                self.voice_client.stop()
+            # Clear queue first: the stopped track's after= callback schedules
+            # play_next, which must find nothing to play during the wait
             self.queue.clear()
+            await self._stop_playback()
             
             # Ensure voice connection
             await self.ensure_voice_client()
@@ -907,7 +995,7 @@ class MusicPlayer:
             loop = asyncio.get_running_loop()
             info = await loop.run_in_executor(
                 self.thread_pool,
-                lambda: self.bot.ytdl.extract_info(url, download=False)
+                lambda: self._ytdl_extract(url, cached=False)
             )
             
             if not info.get('is_live', False):
@@ -925,12 +1013,8 @@ class MusicPlayer:
             self.live_embed = await self.ctx.send(embed=self.live_embed)
             
             # Start live stream
-            audio = discord.FFmpegPCMAudio(
-                self.live_stream['url'],
-                **FFMPEG_OPTIONS,
-                executable=self.bot.config.get('ffmpeg_path', 'ffmpeg')
-            )
-            self.voice_client.play(audio)
+            audio = await self._create_audio_source(info)
+            self._play_audio(audio)
             
             # Start update task
             self.live_task = asyncio.create_task(self._update_live_embed())
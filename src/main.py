@@ -8,12 +8,17 @@ Ce module initialise le bot et gère :
 
 Notes:
     Le bot utilise asyncio pour la gestion asynchrone des événements
-    et signal pour gérer proprement l'arrêt du programme.
+    (avec la boucle uvloop lorsqu'elle est installée) et signal pour
+    gérer proprement l'arrêt du programme.
 """
 
 import asyncio
 import signal
 import logging
+try:
+    import uvloop
+except ImportError:  # uvloop n'est pas disponible sous Windows
+    uvloop = None
 from bot.client import MusicBot
 from utils.logging_config import setup_logging
 
@@ -54,12 +59,15 @@ async def main():
         await bot.start(bot.config['bot_token'])
     except Exception as e:
         # Journalisation des erreurs lors du démarrage
-        logger.error(f"Erreur lors du démarrage du bot : {e}")
+        logger.error("Erreur lors du démarrage du bot : %s", e)
     finally:
         # Assure la fermeture propre du bot dans tous les cas
         await bot.close()
 
 if __name__ == "__main__":
     # Point d'entrée du programme
-    # Exécute la fonction principale dans une boucle asyncio
-    asyncio.run(main())
+    # Exécute la fonction principale dans une boucle uvloop si disponible, asyncio sinon
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -0,0 +1,25 @@
+"""
+Configuration partagée des tests.
+
+Ce module fournit les fixtures communes à tous les tests du bot.
+"""
+
+import asyncio
+import pytest
+
+_real_sleep = asyncio.sleep
+
+@pytest.fixture(autouse=True)
+def _fast_sleep(monkeypatch):
+    """
+    Remplace asyncio.sleep par un simple passage de main à la boucle.
+
+    Notes:
+        - Les délais du lecteur (attente après stop, boucle, déconnexion)
+          n'ont aucune utilité en test et dominent le temps d'exécution
+        - Conserve un point de suspension pour garder l'ordonnancement
+    """
+    async def fast_sleep(delay=0, result=None):
+        return await _real_sleep(0, result)
+
+    monkeypatch.setattr(asyncio, 'sleep', fast_sleep)
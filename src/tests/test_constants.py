@@ -0,0 +1,29 @@
+"""
+Tests unitaires pour les constantes du bot.
+
+Ce module vérifie que les messages utilisés dans le code existent
+bien dans le dictionnaire MESSAGES.
+"""
+
+import re
+from pathlib import Path
+from utils.constants import MESSAGES
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+
+def test_referenced_messages_exist():
+    """
+    Teste que chaque clé MESSAGES['...'] utilisée dans le code est définie.
+    
+    Notes:
+        Une faute de frappe dans une clé n'apparaît sinon qu'à l'exécution,
+        sous forme de KeyError dans le chemin d'erreur concerné
+    """
+    pattern = re.compile(r"MESSAGES\['([A-Z_]+)'\]")
+    missing = {
+        f"{path.relative_to(SRC_DIR)}: {key}"
+        for path in SRC_DIR.rglob('*.py')
+        for key in pattern.findall(path.read_text(encoding='utf-8'))
+        if key not in MESSAGES
+    }
+    assert not missing
@@ -6,8 +6,7 @@ du lecteur de musique et ses différentes fonctionnalités.
 """
 
 import pytest
-import asyncio
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from core.music_player import MusicPlayer
 
 @pytest.fixture
@@ -50,3 +49,56 @@ async def test_add_to_queue(music_player):
     song = music_player.queue[0]
     assert 'url' in song
     assert 'title' in song
+
+@pytest.mark.asyncio
+async def test_add_to_queue_plays_opus_without_reencoding(monkeypatch):
+    """
+    Teste qu'une vidéo Opus ajoutée par add_to_queue est jouée en copie directe.
+    
+    Vérifie:
+        - La chanson garde l'URL de la page plutôt que le lien du flux
+        - play_next crée une source FFmpegOpusAudio, pas FFmpegPCMAudio
+    """
+    import threading
+    from unittest.mock import AsyncMock, MagicMock
+    from utils.ytdl_cache import metadata_cache
+    
+    page_url = "https://www.youtube.com/watch?v=aaaaaaaaaaa"
+    stream_url = "https://rr1.googlevideo.com/videoplayback?id=aaaaaaaaaaa"
+    
+    def extract_info(url, download=False):
+        if url == stream_url:
+            # Un lien direct ne porte pas le codec
+            return {'url': stream_url, 'title': 'videoplayback'}
+        return {
+            'url': stream_url,
+            'webpage_url': page_url,
+            'title': 'Toune',
+            'duration': 180,
+            'acodec': 'opus'
+        }
+    
+    bot = MagicMock()
+    bot.ytdl.extract_info.side_effect = extract_info
+    bot.ytdl_lock = threading.Lock()
+    ctx = MagicMock()
+    ctx.send = AsyncMock()
+    opus_audio = MagicMock()
+    pcm_audio = MagicMock()
+    monkeypatch.setattr('discord.FFmpegOpusAudio', opus_audio)
+    monkeypatch.setattr('discord.FFmpegPCMAudio', pcm_audio)
+    metadata_cache.clear()
+    
+    player = MusicPlayer(bot, ctx)
+    player.voice_client = MagicMock()
+    player.voice_client.is_playing.return_value = False
+    try:
+        await player.add_to_queue(page_url)
+        
+        assert player.current['url'] == page_url
+        opus_audio.assert_called_once()
+        pcm_audio.assert_not_called()
+        player.voice_client.play.assert_called_once()
+    finally:
+        metadata_cache.clear()
+        await player.cleanup()
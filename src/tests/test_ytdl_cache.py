@@ -0,0 +1,78 @@
+"""
+Tests unitaires pour le cache des métadonnées yt-dlp.
+
+Ce module vérifie le calcul des clés, l'expiration et l'éviction
+des entrées du cache partagé.
+"""
+
+import pytest
+from unittest.mock import Mock
+from utils.ytdl_cache import MetadataCache, extract_info, metadata_cache
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    """Isole chaque test du cache partagé du module"""
+    metadata_cache.clear()
+    yield
+    metadata_cache.clear()
+
+def test_make_key_shares_video_id():
+    """
+    Teste que les différentes formes d'URL d'une vidéo partagent la même clé.
+    """
+    urls = [
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://www.youtube.com/watch?list=PL123&v=dQw4w9WgXcQ",
+        "https://youtu.be/dQw4w9WgXcQ?t=42",
+        "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+    ]
+    assert {MetadataCache.make_key(url) for url in urls} == {"dQw4w9WgXcQ"}
+    assert MetadataCache.make_key("lofi hip hop") == "lofi hip hop"
+    other = "https://example.com/watch?v=dQw4w9WgXcQ"
+    assert MetadataCache.make_key(other) == other
+
+def test_make_key_memo_is_bounded():
+    """
+    Teste que la mémorisation des clés ne dépasse pas sa taille maximale.
+    """
+    maxsize = MetadataCache.make_key.cache_info().maxsize
+    for i in range(maxsize + 10):
+        MetadataCache.make_key(f"recherche {i}")
+    assert MetadataCache.make_key.cache_info().currsize == maxsize
+
+def test_entries_expire_and_evict():
+    """
+    Teste l'expiration des entrées et l'éviction LRU.
+
+    Vérifie:
+        - Une entrée expirée n'est plus retournée
+        - L'entrée la moins récemment utilisée est évincée en premier
+    """
+    expired = MetadataCache(max_size=2, ttl=-1)
+    expired.set("https://youtu.be/aaaaaaaaaaa", {'title': 'A'})
+    assert expired.get("https://youtu.be/aaaaaaaaaaa") is None
+
+    cache = MetadataCache(max_size=2, ttl=60)
+    cache.set("https://youtu.be/aaaaaaaaaaa", {'title': 'A'})
+    cache.set("https://youtu.be/bbbbbbbbbbb", {'title': 'B'})
+    cache.get("https://youtu.be/aaaaaaaaaaa")
+    cache.set("https://youtu.be/ccccccccccc", {'title': 'C'})
+    assert cache.get("https://youtu.be/bbbbbbbbbbb") is None
+    assert cache.get("https://youtu.be/aaaaaaaaaaa") == {'title': 'A'}
+
+def test_extract_info_skips_live_streams():
+    """
+    Teste que seules les vidéos ordinaires sont mises en cache, réduites
+    aux champs utilisés par le lecteur.
+    """
+    ydl = Mock()
+    ydl.extract_info.return_value = {'url': 'stream', 'title': 'Vidéo', 'formats': [{}]}
+    extract_info(ydl, "https://youtu.be/aaaaaaaaaaa")
+    info = extract_info(ydl, "https://www.youtube.com/watch?v=aaaaaaaaaaa")
+    assert ydl.extract_info.call_count == 1
+    assert info == {'url': 'stream', 'title': 'Vidéo'}
+
+    ydl.extract_info.return_value = {'url': 'stream', 'title': 'Direct', 'is_live': True}
+    extract_info(ydl, "https://youtu.be/bbbbbbbbbbb")
+    extract_info(ydl, "https://youtu.be/bbbbbbbbbbb")
+    assert ydl.extract_info.call_count == 3
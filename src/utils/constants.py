@@ -1,8 +1,9 @@
-import subprocess
+import sys
+from types import MappingProxyType
 
 # Configuration YT-DLP
-YTDL_OPTIONS = {
-    'format': 'bestaudio',
+YTDL_OPTIONS = MappingProxyType({
+    'format': 'bestaudio[acodec=opus]/bestaudio',  # Opus d'abord pour éviter le réencodage
     'quiet': True,
     'no_warnings': True,
     'extract_flat': False,
@@ -16,9 +17,9 @@ YTDL_OPTIONS = {
     'buffersize': 32768,
     'postprocessors': [],
     'cachedir': False
-}
+})
 
-YTDL_OPTIONS_LIVE = {
+YTDL_OPTIONS_LIVE = MappingProxyType({
     'format': 'best',
     'extractaudio': True,
     'audioformat': 'mp3',
@@ -36,26 +37,70 @@ YTDL_OPTIONS_LIVE = {
     'source_address': '0.0.0.0',
     'is_live': True,
     'live_buffer': 1800,
+})
+
+# Extraction rapide pour l'ajout de listes de lecture et de recherches
+_YTDL_EXTRACT_BASE = {
+    'quiet': True,
+    'no_warnings': True,
+    'format': 'ba[ext=webm]',  # Prefer webm audio format
+    'concurrent_fragments': 10,
+    'postprocessor_args': {
+        'ffmpeg': ['-threads', '3']
+    },
+    'buffersize': 131072,  # Doubled buffer size
+    'socket_timeout': 2,
+    'extractor_retries': 1,
+    'nocheckcertificate': True,
+    'prefer_insecure': True,
+    'http_chunk_size': 20971520,  # 20MB chunks
+    'live_from_start': False,
+    'cachedir': False,
+    'progress_hooks': [],
+    'no_color': True,
 }
 
+YTDL_EXTRACT_URL_OPTIONS = MappingProxyType({
+    **_YTDL_EXTRACT_BASE,
+    'extract_flat': 'in_playlist',
+    'default_search': None,
+})
+
+YTDL_EXTRACT_SEARCH_OPTIONS = MappingProxyType({
+    **_YTDL_EXTRACT_BASE,
+    'extract_flat': False,
+    'default_search': 'ytsearch',
+})
+
+# Cache des métadonnées YT-DLP
+YTDL_METADATA_CACHE_SIZE = 2048  # Nombre de vidéos conservées
+YTDL_METADATA_TTL = 3600         # Durée de vie en secondes, sous l'expiration des URLs de flux
+
 # Configuration FFMPEG
-FFMPEG_OPTIONS = {
-    'before_options': '-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5',
-    'options': '-vn -ar 48000 -ac 2 -f s16le -acodec pcm_s16le'
-}
+FFMPEG_OPTIONS = MappingProxyType({
+    'before_options': (
+        '-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5 '
+        # Démarrage rapide : analyse minimale du flux avant la première trame
+        '-fflags nobuffer -flags low_delay -analyzeduration 0 -probesize 4096 '
+        # File de paquets d'entrée élargie pour éviter les coupures sous charge
+        '-thread_queue_size 4096'
+    ),
+    # Le format de sortie (s16le 48 kHz stéréo ou Opus) est imposé par discord.py
+    'options': '-vn -loglevel error'
+})
 
 # Couleurs des Embeds Discord
-COLORS = {
+COLORS = MappingProxyType({
     'SUCCESS': 0x2ecc71,  # Vert
     'ERROR': 0xe74c3c,    # Rouge
     'WARNING': 0xf1c40f,  # Jaune
     'INFO': 0x3498db      # Bleu
-}
+})
 
 # Messages du bot
 MESSAGES = {
-    'PLAYLIST_ADDED': "✅ {} tounes ajoutées à la queue",
-    'SONGS_ADDED': "✅ {total} chansons ajoutées à la file d\'attente",
+    'PLAYLIST_ADDED': "✅ %d tounes ajoutées à la queue",
+    'SONGS_ADDED': "✅ %d chansons ajoutées à la file d\'attente",
     'SONG_ADDED': "✅ Toune ajoutée à la queue",
     'ERROR_TITLE': "❌ Erreur",
     'GOODBYE': "On s'revoit bein tôt mon t'cham! 👋",
@@ -64,7 +109,7 @@ MESSAGES = {
     'QUEUE_EMPTY_SAD': "LLA queue est morte 😢",
     'NOW_PLAYING': "🎵 En lecture",
     'NEXT_SONGS': "Prochaine chanson",
-    'REMAINING_SONGS': "+{} autres chanzons en attente",
+    'REMAINING_SONGS': "+%d autres chanzons en attente",
     'SUPPORT_TITLE': "🆘 Demande de Support",
     'SUPPORT_SENT': "✅ Votre message a été envoyé au god du bot!",
     'DM_ERROR': "Je ne peux pas vous envoyer de messages privés. Veuillez activer les messages privés pour ce serveur.",
@@ -73,17 +118,22 @@ MESSAGES = {
     'NOTHING_PLAYING': "Rian joue mon'homme",
     'SKIPPED': "Skippé",
     'QUEUE_PURGED': "Purge complete de la queue",
-    'LOOP_ENABLED': "🔁 En boucle : {}",
+    'LOOP_ENABLED': "🔁 En boucle : %s",
     'LOOP_DISABLED': "➡️ Mode boucle désactivé",
-    'LOOP_SINCE': "Depuis : {}",
-    'LOOP_BY': "Loop initié par : {}",
+    'LOOP_SINCE': "Depuis : %s",
+    'LOOP_BY': "Loop initié par : %s",
     'PLAYLIST_ERROR': "Impossible de mettre une liste de lecture en boucle. Veuillez fournir un lien vers une seule vidéo.",
     'CLEANUP_START': "🧹 Nettoyage en cours...",
     'CLEANUP_COMPLETE': "✨ Nettoyage complet effectué!",
-    'CLEANUP_ERROR': "Erreur lors du nettoyage: {}",
+    'CLEANUP_ERROR': "Erreur lors du nettoyage: %s",
     'LIVE_STARTED': "🔴 Diffusion en direct démarrée",
     'LIVE_STOPPED': "⭕ Diffusion en direct arrêtée",
     'LIVE_ERROR': "❌ Erreur lors du chargement du direct",
     'LIVE_NOT_FOUND': "❌ Aucune diffusion en direct trouvée",
+    'VIDEO_UNAVAILABLE': "❌ Vidéo non disponible",
     'PLAYBACK_STOPPED': '⏹️ Lecture arrêtée'
-}
\ No newline at end of file
+}
+
+# Internement des messages : comparaisons par identité et une seule copie en mémoire.
+# Toutes les tables de ce module sont en lecture seule (MappingProxyType).
+MESSAGES = MappingProxyType({key: sys.intern(value) for key, value in MESSAGES.items()})
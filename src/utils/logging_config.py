@@ -1,11 +1,20 @@
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# Skip record fields that no formatter uses
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 
 def setup_logging():
     """
     Configure logging for the bot with both file and console output.
     Creates rotating log files with a max size of 10MB, keeping 5 backup files.
+    Records are handed to a background thread through a queue, so file and
+    console I/O never run on the event loop.
     """
     # Create logs directory if it doesn't exist
     if not os.path.exists('logs'):
@@ -15,9 +24,15 @@ def setup_logging():
     logger = logging.getLogger()
     logger.setLevel(logging.INFO)
 
-    # Format for logs
+    # Already configured: don't stack a second set of handlers
+    if any(isinstance(handler, QueueHandler) for handler in logger.handlers):
+        return
+
+    # Format for logs (fixed datefmt skips the default millisecond suffix)
     formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%dT%H:%M:%S',
+        style='%'
     )
 
     # File handler with rotation
@@ -35,6 +50,12 @@ def setup_logging():
     console_handler.setFormatter(formatter)
     console_handler.setLevel(logging.INFO)
 
-    # Add handlers to root logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler) 
\ No newline at end of file
+    # Root logger only enqueues; the listener thread does the writing
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    logger.addHandler(QueueHandler(log_queue))
@@ -0,0 +1,122 @@
+"""
+Cache en mémoire des métadonnées yt-dlp.
+
+Ce module évite de relancer une extraction yt-dlp pour une vidéo résolue
+récemment : les résultats sont conservés par identifiant YouTube pendant
+une durée limitée, avec éviction des entrées les moins récemment utilisées.
+"""
+
+import re
+import time
+from collections import OrderedDict
+from contextlib import nullcontext
+from functools import lru_cache
+from threading import Lock
+from utils.constants import YTDL_METADATA_CACHE_SIZE, YTDL_METADATA_TTL
+
+# Limité aux hôtes YouTube : un paramètre v= sur un autre site ne doit pas
+# partager l'entrée d'une vidéo YouTube
+_VIDEO_ID_PATTERN = re.compile(
+    r'(?:^|//)(?:[\w-]+\.)*(?:youtube\.com/(?:watch\?(?:[^#]*&)?v=|shorts/|embed/|live/)|youtu\.be/)'
+    r'([\w-]{11})'
+)
+
+# Seuls champs lus par le lecteur : le dict complet de yt-dlp (formats,
+# sous-titres, miniatures, en-têtes) pèse souvent des centaines de Ko
+_CACHED_FIELDS = ('url', 'title', 'duration', 'acodec', 'webpage_url')
+
+class MetadataCache:
+    """
+    Cache LRU à durée de vie limitée pour les résultats de extract_info.
+
+    Attributes:
+        max_size (int): Nombre maximal d'entrées conservées
+        ttl (float): Durée de vie d'une entrée en secondes
+
+    Notes:
+        - Les URLs d'une même vidéo partagent la même entrée
+        - Thread-safe : les extractions s'exécutent dans un pool de threads
+    """
+
+    def __init__(self, max_size=YTDL_METADATA_CACHE_SIZE, ttl=YTDL_METADATA_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def make_key(url):
+        """
+        Calcule la clé de cache d'une URL.
+
+        Args:
+            url (str): URL ou requête passée à yt-dlp
+
+        Returns:
+            str: Identifiant YouTube à 11 caractères, ou l'URL telle quelle
+
+        Notes:
+            Mémorisé : une même URL est résolue à chaque get/set et à chaque
+            répétition d'une chanson dans la file
+        """
+        match = _VIDEO_ID_PATTERN.search(url)
+        return match.group(1) if match else url
+
+    def get(self, url):
+        """Retourne les informations en cache pour l'URL, ou None si absentes ou expirées"""
+        key = self.make_key(url)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, info = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return info
+
+    def set(self, url, info):
+        """Enregistre les informations extraites pour l'URL"""
+        key = self.make_key(url)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, info)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Vide le cache"""
+        with self._lock:
+            self._entries.clear()
+
+metadata_cache = MetadataCache()
+
+def extract_info(ydl, url, lock=None):
+    """
+    Extrait les informations d'une vidéo en passant par le cache partagé.
+
+    Args:
+        ydl (YoutubeDL): Instance yt-dlp utilisée en cas d'absence du cache
+        url (str): URL de la vidéo
+        lock (Lock, optional): Verrou de l'instance ydl, tenu pendant l'extraction
+
+    Returns:
+        dict: Champs utiles (url, title, duration, acodec, webpage_url) pour
+            une vidéo, ou informations complètes de yt-dlp pour un direct
+            ou une liste de lecture
+
+    Notes:
+        - Bloquant : à exécuter dans un pool de threads
+        - Les directs et les listes de lecture ne sont jamais mis en cache
+    """
+    info = metadata_cache.get(url)
+    if info is None:
+        # YoutubeDL n'est pas thread-safe : une extraction à la fois par instance
+        with lock or nullcontext():
+            info = ydl.extract_info(url, download=False)
+        if info and not info.get('is_live') and 'entries' not in info:
+            info = {field: info[field] for field in _CACHED_FIELDS if field in info}
+            metadata_cache.set(url, info)
+    return info